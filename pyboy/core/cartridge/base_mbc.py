@@ -3,7 +3,6 @@
 # GitHub: https://github.com/Baekalfen/PyBoy
 #
 
-import array
 import logging
 import os
 
@@ -73,8 +72,7 @@ class BaseMBC:
             return
 
         for bank in range(self.external_ram_count):
-            for byte in range(8 * 1024):
-                f.write(self.rambanks[bank][byte])
+            f.write_bytes(self.rambanks[bank][:8 * 1024])
 
         logger.debug("RAM saved.")
 
@@ -97,7 +95,7 @@ class BaseMBC:
 
         # In real life the values in RAM are scrambled on initialization.
         # Allocating the maximum, as it is easier in Cython. And it's just 128KB...
-        self.rambanks = [array.array("B", [0] * (8*1024)) for _ in range(16)]
+        self.rambanks = [bytearray(8 * 1024) for _ in range(16)]
 
     def getgamename(self, rombanks):
         return "".join([chr(x) for x in rombanks[0][0x0134:0x0142]]).rstrip("\0")
@@ -157,7 +155,8 @@ class ROMOnly(BaseMBC):
             if value == 0:
                 value = 1
             self.rombank_selected = (value & 0b1)
-            logger.debug("Switching bank 0x%0.4x, 0x%0.2x" % (address, value))
+            # Let logging format the message, so it's skipped when the level is disabled
+            logger.debug("Switching bank 0x%0.4x, 0x%0.2x", address, value)
         elif 0xA000 <= address < 0xC000:
             if self.rambanks is None:
                 from . import EXTERNAL_RAM_TABLE
@@ -169,4 +168,4 @@ class ROMOnly(BaseMBC):
                 self.init_rambanks(EXTERNAL_RAM_TABLE[0x02])
             self.rambanks[self.rambank_selected][address - 0xA000] = value
         else:
-            logger.warning("Unexpected write to 0x%0.4x, value: 0x%0.2x" % (address, value))
+            logger.warning("Unexpected write to 0x%0.4x, value: 0x%0.2x", address, value)
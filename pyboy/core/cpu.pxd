@@ -22,8 +22,8 @@ cdef short VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW
 
 cdef class CPU:
 
-    cdef bint interrupt_master_enable, break_allow, break_on, halted, stopped, profiling
-    cdef uint64_t old_pc, break_next
+    cdef bint interrupt_master_enable, halted, stopped, profiling
+    cdef uint64_t old_pc
 
     cdef object debug_callstack
     cdef int[512] hitrate
@@ -136,10 +136,6 @@ class CPU:
 
         self.interrupt_master_enable = False
 
-        self.break_allow = True
-        self.break_on = False
-        self.break_next = 0
-
         self.halted = False
         self.stopped = False
 
@@ -173,7 +169,14 @@ class CPU:
         )
 
     def fetch_and_execute(self, pc):
-        opcode = self.mb.getitem(pc)
+        # Nearly all instructions are fetched from the cartridge ROM or internal RAM. For those, we skip the address
+        # decoding in the motherboard. The boot-ROM only overlays 0x0000-0x00FF.
+        if 0x0100 <= pc < 0x8000:
+            opcode = self.mb.cartridge.getitem(pc)
+        elif 0xC000 <= pc < 0xE000:
+            opcode = self.mb.ram.memory[pc - 0xC000]
+        else:
+            opcode = self.mb.getitem(pc)
         if opcode == 0xCB: # Extension code
             pc += 1
             opcode = self.mb.getitem(pc)
@@ -66,7 +66,7 @@ cdef class Renderer:
     cdef str color_format
     cdef tuple buffer_dims
     cdef bint clearcache
-    cdef set tiles_changed
+    cdef uint8_t[384] tiles_changed # TILES
 
     cdef array _screenbuffer_raw
     cdef array _tilecache_raw, _spritecache0_raw, _spritecache1_raw
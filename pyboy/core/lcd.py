@@ -24,8 +24,8 @@ except ImportError:
 
 class LCD:
     def __init__(self, randomize=False):
-        self.VRAM = array("B", [0] * VIDEO_RAM)
-        self.OAM = array("B", [0] * OBJECT_ATTRIBUTE_MEMORY)
+        self.VRAM = bytearray(VIDEO_RAM)
+        self.OAM = bytearray(OBJECT_ATTRIBUTE_MEMORY)
 
         self.LCDC = LCDCRegister(0)
         # self.STAT = 0x00
@@ -47,11 +47,8 @@ class LCD:
                 self.OAM[i] = getrandbits(8)
 
     def save_state(self, f):
-        for n in range(VIDEO_RAM):
-            f.write(self.VRAM[n])
-
-        for n in range(OBJECT_ATTRIBUTE_MEMORY):
-            f.write(self.OAM[n])
+        f.write_bytes(self.VRAM[:VIDEO_RAM])
+        f.write_bytes(self.OAM[:OBJECT_ATTRIBUTE_MEMORY])
 
         f.write(self.LCDC.value)
         f.write(self.BGP.value)
@@ -136,7 +133,7 @@ class Renderer:
         self.buffer_dims = (160, 144)
 
         self.clearcache = False
-        self.tiles_changed = set([])
+        self.tiles_changed = bytearray(TILES) # One flag for each tile
 
         # Init buffers as white
         self._screenbuffer_raw = array("B", [0xFF] * (ROWS*COLS*4))
@@ -246,16 +243,19 @@ class Renderer:
 
     def update_cache(self, lcd):
         if self.clearcache:
-            self.tiles_changed.clear()
-            for x in range(0x8000, 0x9800, 16):
-                self.tiles_changed.add(x)
+            for t in range(TILES):
+                self.tiles_changed[t] = 1
             self.clearcache = False
 
-        for t in self.tiles_changed:
-            for k in range(0, 16, 2): # 2 bytes for each line
-                byte1 = lcd.VRAM[t + k - 0x8000]
-                byte2 = lcd.VRAM[t + k + 1 - 0x8000]
-                y = (t+k-0x8000) // 2
+        for t in range(TILES):
+            if not self.tiles_changed[t]:
+                continue
+            self.tiles_changed[t] = 0
+
+            for k in range(t * 16, t*16 + 16, 2): # 2 bytes for each line
+                byte1 = lcd.VRAM[k]
+                byte2 = lcd.VRAM[k + 1]
+                y = k // 2
 
                 for x in range(8):
                     colorcode = color_code(byte1, byte2, 7 - x)
@@ -268,8 +268,6 @@ class Renderer:
                         self._spritecache0[y][x] &= ~self.alphamask
                         self._spritecache1[y][x] &= ~self.alphamask
 
-        self.tiles_changed.clear()
-
     def blank_screen(self):
         # If the screen is off, fill it with a color.
         color = self.color_palette[0]
@@ -20,6 +20,8 @@ from pyboy.utils cimport WindowEvent
 
 cdef uint16_t STAT, LY, LYC
 cdef short VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW
+cdef uint8_t[256] MEMORY_REGIONS
+cdef uint8_t[0x4C] IO_READ_HOOKS, IO_WRITE_HOOKS
 
 
 
@@ -31,26 +33,28 @@ cdef class Motherboard:
     cdef pyboy.core.lcd.Renderer renderer
     cdef pyboy.core.cpu.CPU cpu
     cdef pyboy.core.timer.Timer timer
-    cdef bint sound_enabled
     cdef pyboy.core.sound.Sound sound
     cdef pyboy.core.cartridge.base_mbc.BaseMBC cartridge
     cdef bint bootrom_enabled
     cdef bint disable_renderer
-    cdef str serialbuffer
+    cdef bytearray serialbuffer
     cdef int cycles_remaining
 
     cdef void buttonevent(self, WindowEvent)
     cdef void stop(self, bint)
+    @cython.locals(stat=uint8_t)
     cdef void set_STAT_mode(self, int)
     cdef void check_LYC(self, int)
-    @cython.locals(cycles=cython.int)
+    @cython.locals(cycles=cython.int, cycles_remaining=cython.int)
     cdef void calculate_cycles(self, int)
     cdef void tickframe(self)
 
+    @cython.locals(region=uint8_t)
     cdef uint8_t getitem(self, uint16_t)
+    @cython.locals(region=uint8_t)
     cdef void setitem(self, uint16_t, uint8_t)
 
-    @cython.locals(offset=cython.int, dst=cython.int, n=cython.int)
+    @cython.locals(offset=cython.int, n=cython.int)
     cdef void transfer_DMA(self, uint8_t)
     cdef void save_state(self, IntIOInterface)
     cdef void load_state(self, IntIOInterface)
@@ -4,6 +4,7 @@
 #
 
 import logging
+from array import array
 
 from pyboy.utils import STATE_VERSION
 
@@ -14,6 +15,38 @@ logger = logging.getLogger(__name__)
 VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW = range(5)
 STAT, _, _, LY, LYC = range(0xFF41, 0xFF46)
 
+# Maps the upper byte of an address to the first page of its memory region. Only page 0xFE and 0xFF hold more than one
+# region, and need to be decoded further. The base address of each region is subtracted as a literal in getitem/setitem,
+# which is cheaper than looking it up in a table as well.
+# yapf: disable
+MEMORY_REGIONS = array("B",
+    [0x00] * 0x40 + # 16kB ROM bank #0
+    [0x40] * 0x40 + # 16kB switchable ROM bank
+    [0x80] * 0x20 + # 8kB Video RAM
+    [0xA0] * 0x20 + # 8kB switchable RAM bank
+    [0xC0] * 0x20 + # 8kB Internal RAM
+    [0xE0] * 0x1E + # Echo of 8kB Internal RAM
+    [0xFE, 0xFF]
+)
+
+# Flags the I/O ports (0xFF00-0xFF4B), which are not plain registers in RAM. These are either stored outside of RAM or
+# have side effects, and have to go through the switch in getitem/setitem.
+IO_READ_HOOKS = array("B",
+    [0, 0, 0, 0] +
+    [1, 1, 1, 1] + # Timer
+    [0] * 0x08 +
+    [1] * 0x30 + # Sound
+    [1, 0, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1] # LCD
+)
+IO_WRITE_HOOKS = array("B",
+    [1, 1, 0, 0] + # Joypad and serial
+    [1, 1, 1, 1] + # Timer
+    [0] * 0x08 +
+    [1] * 0x30 + # Sound
+    [1, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1] # LCD and DMA
+)
+# yapf: enable
+
 
 class Motherboard:
     def __init__(
@@ -41,16 +74,17 @@ class Motherboard:
         self.lcd = lcd.LCD(randomize=randomize)
         self.renderer = lcd.Renderer(color_palette)
         self.disable_renderer = disable_renderer
-        self.sound_enabled = sound_enabled
         if sound_enabled:
             self.sound = sound.Sound()
+        else:
+            self.sound = sound.NullSound()
         self.bootrom_enabled = True
-        self.serialbuffer = ""
+        self.serialbuffer = bytearray()
         self.cycles_remaining = 0
 
     def getserial(self):
-        b = self.serialbuffer
-        self.serialbuffer = ""
+        b = self.serialbuffer.decode("latin-1")
+        self.serialbuffer = bytearray()
         return b
 
     def buttonevent(self, key):
@@ -58,8 +92,7 @@ class Motherboard:
             self.cpu.set_interruptflag(HIGHTOLOW)
 
     def stop(self, save):
-        if self.sound_enabled:
-            self.sound.stop()
+        self.sound.stop()
         if save:
             self.cartridge.stop()
 
@@ -69,10 +102,7 @@ class Motherboard:
         f.write(self.bootrom_enabled)
         self.cpu.save_state(f)
         self.lcd.save_state(f)
-        if self.sound_enabled:
-            self.sound.save_state(f)
-        else:
-            pass
+        self.sound.save_state(f)
         self.renderer.save_state(f)
         self.ram.save_state(f)
         self.timer.save_state(f)
@@ -112,28 +142,32 @@ class Motherboard:
     # Coordinator
     #
 
+    # STAT, LY and LYC have no side effects in getitem/setitem, so the two functions below access them directly in
+    # the I/O ports of the RAM.
+
     # TODO: Move out of MB
     def set_STAT_mode(self, mode):
-        self.setitem(STAT, self.getitem(STAT) & 0b11111100) # Clearing 2 LSB
-        self.setitem(STAT, self.getitem(STAT) | mode) # Apply mode to LSB
+        stat = (self.ram.memory[STAT - 0xC000] & 0b11111100) | mode # Clearing 2 LSB and apply mode
+        self.ram.memory[STAT - 0xC000] = stat
 
         # Mode "3" is not interruptable
-        if self.cpu.test_ramregisterflag(STAT, mode + 3) and mode != 3:
+        if stat & (1 << (mode + 3)) and mode != 3:
             self.cpu.set_interruptflag(LCDC)
 
     # TODO: Move out of MB
     def check_LYC(self, y):
-        self.setitem(LY, y)
-        if self.getitem(LYC) == y:
-            self.setitem(STAT, self.getitem(STAT) | 0b100) # Sets the LYC flag
-            if self.getitem(STAT) & 0b01000000:
+        self.ram.memory[LY - 0xC000] = y
+        if self.ram.memory[LYC - 0xC000] == y:
+            self.ram.memory[STAT - 0xC000] |= 0b100 # Sets the LYC flag
+            if self.ram.memory[STAT - 0xC000] & 0b01000000:
                 self.cpu.set_interruptflag(LCDC)
         else:
-            self.setitem(STAT, self.getitem(STAT) & 0b11111011)
+            self.ram.memory[STAT - 0xC000] &= 0b11111011
 
     def calculate_cycles(self, cycles_period):
-        self.cycles_remaining += cycles_period
-        while self.cycles_remaining > 0:
+        # Run the loop on a local counter, and only store it back once we are done
+        cycles_remaining = self.cycles_remaining + cycles_period
+        while cycles_remaining > 0:
             cycles = self.cpu.tick()
 
             # TODO: Benchmark whether 'if' and 'try/except' is better
@@ -146,18 +180,18 @@ class Motherboard:
                 # For HiToLo interrupt it is indistinguishable whether
                 # it gets triggered mid-frame or by next frame
                 # Serial is not implemented, so this isn't a concern
-                cycles = min(self.timer.cyclestointerrupt(), self.cycles_remaining)
+                cycles = min(self.timer.cyclestointerrupt(), cycles_remaining)
 
                 # Profiling
                 if self.cpu.profiling:
                     self.cpu.hitrate[0x76] += cycles // 4
 
-            if self.sound_enabled:
-                self.sound.clock += cycles
-            self.cycles_remaining -= cycles
+            self.sound.clock += cycles
+            cycles_remaining -= cycles
 
             if self.timer.tick(cycles):
                 self.cpu.set_interruptflag(TIMER)
+        self.cycles_remaining = cycles_remaining
 
     def tickframe(self):
         lcdenabled = self.lcd.LCDC.lcd_enable
@@ -204,153 +238,173 @@ class Motherboard:
 
             for y in range(154):
                 self.calculate_cycles(456)
-        if self.sound_enabled:
-            self.sound.sync()
+        self.sound.sync()
 
     ###################################################################
     # MemoryManager
     #
     def getitem(self, i):
-        if 0x0000 <= i < 0x4000: # 16kB ROM bank #0
+        # Only compare 'region' to literals below, so Cython compiles the chain into a C switch
+        region = MEMORY_REGIONS[i >> 8]
+        if region == 0x00: # 16kB ROM bank #0
             if i <= 0xFF and self.bootrom_enabled:
                 return self.bootrom.getitem(i)
             else:
                 return self.cartridge.getitem(i)
-        elif 0x4000 <= i < 0x8000: # 16kB switchable ROM bank
+        elif region == 0x40: # 16kB switchable ROM bank
             return self.cartridge.getitem(i)
-        elif 0x8000 <= i < 0xA000: # 8kB Video RAM
+        elif region == 0x80: # 8kB Video RAM
             return self.lcd.VRAM[i - 0x8000]
-        elif 0xA000 <= i < 0xC000: # 8kB switchable RAM bank
+        elif region == 0xA0: # 8kB switchable RAM bank
             return self.cartridge.getitem(i)
-        elif 0xC000 <= i < 0xE000: # 8kB Internal RAM
-            return self.ram.internal_ram0[i - 0xC000]
-        elif 0xE000 <= i < 0xFE00: # Echo of 8kB Internal RAM
-            # Redirect to internal RAM
-            return self.getitem(i - 0x2000)
-        elif 0xFE00 <= i < 0xFEA0: # Sprite Attribute Memory (OAM)
-            return self.lcd.OAM[i - 0xFE00]
-        elif 0xFEA0 <= i < 0xFF00: # Empty but unusable for I/O
-            return self.ram.non_io_internal_ram0[i - 0xFEA0]
-        elif 0xFF00 <= i < 0xFF4C: # I/O ports
-            if i == 0xFF04:
-                return self.timer.DIV
-            elif i == 0xFF05:
-                return self.timer.TIMA
-            elif i == 0xFF06:
-                return self.timer.TMA
-            elif i == 0xFF07:
-                return self.timer.TAC
-            elif 0xFF10 <= i < 0xFF40:
-                if self.sound_enabled:
+        elif region == 0xC0: # 8kB Internal RAM
+            return self.ram.memory[i - 0xC000]
+        elif region == 0xE0: # Echo of 8kB Internal RAM
+            # Read internal RAM directly (i - 0x2000 - 0xC000)
+            return self.ram.memory[i - 0xE000]
+        elif region == 0xFE:
+            if i < 0xFEA0: # Sprite Attribute Memory (OAM)
+                return self.lcd.OAM[i - 0xFE00]
+            else: # Empty but unusable for I/O
+                return self.ram.memory[i - 0xC000]
+        elif region == 0xFF:
+            if i < 0xFF4C: # I/O ports
+                if not IO_READ_HOOKS[i - 0xFF00]:
+                    return self.ram.memory[i - 0xC000]
+
+                if 0xFF10 <= i < 0xFF40:
                     return self.sound.get(i - 0xFF10)
+
+                # Only compare 'i' to literals below, so Cython compiles the chain into a C switch
+                if i == 0xFF04:
+                    return self.timer.DIV
+                elif i == 0xFF05:
+                    return self.timer.TIMA
+                elif i == 0xFF06:
+                    return self.timer.TMA
+                elif i == 0xFF07:
+                    return self.timer.TAC
+                elif i == 0xFF40:
+                    return self.lcd.LCDC.value
+                elif i == 0xFF42:
+                    return self.lcd.SCY
+                elif i == 0xFF43:
+                    return self.lcd.SCX
+                elif i == 0xFF47:
+                    return self.lcd.BGP.value
+                elif i == 0xFF48:
+                    return self.lcd.OBP0.value
+                elif i == 0xFF49:
+                    return self.lcd.OBP1.value
+                elif i == 0xFF4A:
+                    return self.lcd.WY
+                elif i == 0xFF4B:
+                    return self.lcd.WX
                 else:
-                    return 0
-            elif i == 0xFF40:
-                return self.lcd.LCDC.value
-            elif i == 0xFF42:
-                return self.lcd.SCY
-            elif i == 0xFF43:
-                return self.lcd.SCX
-            elif i == 0xFF47:
-                return self.lcd.BGP.value
-            elif i == 0xFF48:
-                return self.lcd.OBP0.value
-            elif i == 0xFF49:
-                return self.lcd.OBP1.value
-            elif i == 0xFF4A:
-                return self.lcd.WY
-            elif i == 0xFF4B:
-                return self.lcd.WX
-            else:
-                return self.ram.io_ports[i - 0xFF00]
-        elif 0xFF4C <= i < 0xFF80: # Empty but unusable for I/O
-            return self.ram.non_io_internal_ram1[i - 0xFF4C]
-        elif 0xFF80 <= i < 0xFFFF: # Internal RAM
-            return self.ram.internal_ram1[i - 0xFF80]
-        elif i == 0xFFFF: # Interrupt Enable Register
-            return self.ram.interrupt_register[0]
+                    return self.ram.memory[i - 0xC000]
+            else: # Empty but unusable for I/O, internal RAM and Interrupt Enable Register
+                return self.ram.memory[i - 0xC000]
         else:
             raise IndexError("Memory access violation. Tried to read: %s" % hex(i))
 
     def setitem(self, i, value):
+        # Stripped by 'python -O'. When compiled, 'value' is a uint8_t, and the comparison is always true.
         assert 0 <= value < 0x100, "Memory write error! Can't write %s to %s" % (hex(value), hex(i))
 
-        if 0x0000 <= i < 0x4000: # 16kB ROM bank #0
+        # See getitem
+        region = MEMORY_REGIONS[i >> 8]
+        if region == 0x00: # 16kB ROM bank #0
             # Doesn't change the data. This is for MBC commands
             self.cartridge.setitem(i, value)
-        elif 0x4000 <= i < 0x8000: # 16kB switchable ROM bank
+        elif region == 0x40: # 16kB switchable ROM bank
             # Doesn't change the data. This is for MBC commands
             self.cartridge.setitem(i, value)
-        elif 0x8000 <= i < 0xA000: # 8kB Video RAM
+        elif region == 0x80: # 8kB Video RAM
             self.lcd.VRAM[i - 0x8000] = value
             if i < 0x9800: # Is within tile data -- not tile maps
-                # Mask out the byte of the tile
-                self.renderer.tiles_changed.add(i & 0xFFF0)
-        elif 0xA000 <= i < 0xC000: # 8kB switchable RAM bank
+                # Flag the tile, which the byte belongs to
+                self.renderer.tiles_changed[(i - 0x8000) >> 4] = 1
+        elif region == 0xA0: # 8kB switchable RAM bank
             self.cartridge.setitem(i, value)
-        elif 0xC000 <= i < 0xE000: # 8kB Internal RAM
-            self.ram.internal_ram0[i - 0xC000] = value
-        elif 0xE000 <= i < 0xFE00: # Echo of 8kB Internal RAM
-            self.setitem(i - 0x2000, value) # Redirect to internal RAM
-        elif 0xFE00 <= i < 0xFEA0: # Sprite Attribute Memory (OAM)
-            self.lcd.OAM[i - 0xFE00] = value
-        elif 0xFEA0 <= i < 0xFF00: # Empty but unusable for I/O
-            self.ram.non_io_internal_ram0[i - 0xFEA0] = value
-        elif 0xFF00 <= i < 0xFF4C: # I/O ports
-            if i == 0xFF00:
-                self.ram.io_ports[i - 0xFF00] = self.interaction.pull(value)
-            elif i == 0xFF01:
-                self.serialbuffer += chr(value)
-                self.ram.io_ports[i - 0xFF00] = value
-            elif i == 0xFF04:
-                self.timer.DIV = 0
-            elif i == 0xFF05:
-                self.timer.TIMA = value
-            elif i == 0xFF06:
-                self.timer.TMA = value
-            elif i == 0xFF07:
-                self.timer.TAC = value & 0b111
-            elif 0xFF10 <= i < 0xFF40:
-                if self.sound_enabled:
+        elif region == 0xC0: # 8kB Internal RAM
+            self.ram.memory[i - 0xC000] = value
+        elif region == 0xE0: # Echo of 8kB Internal RAM
+            # Write internal RAM directly (i - 0x2000 - 0xC000)
+            self.ram.memory[i - 0xE000] = value
+        elif region == 0xFE:
+            if i < 0xFEA0: # Sprite Attribute Memory (OAM)
+                self.lcd.OAM[i - 0xFE00] = value
+            else: # Empty but unusable for I/O
+                self.ram.memory[i - 0xC000] = value
+        elif region == 0xFF:
+            if i < 0xFF4C: # I/O ports
+                if not IO_WRITE_HOOKS[i - 0xFF00]:
+                    self.ram.memory[i - 0xC000] = value
+                    return
+
+                if 0xFF10 <= i < 0xFF40:
                     self.sound.set(i - 0xFF10, value)
-            elif i == 0xFF40:
-                self.lcd.LCDC.set(value)
-            elif i == 0xFF42:
-                self.lcd.SCY = value
-            elif i == 0xFF43:
-                self.lcd.SCX = value
-            elif i == 0xFF46:
-                self.transfer_DMA(value)
-            elif i == 0xFF47:
-                # TODO: Move out of MB
-                self.renderer.clearcache |= self.lcd.BGP.set(value)
-            elif i == 0xFF48:
-                # TODO: Move out of MB
-                self.renderer.clearcache |= self.lcd.OBP0.set(value)
-            elif i == 0xFF49:
-                # TODO: Move out of MB
-                self.renderer.clearcache |= self.lcd.OBP1.set(value)
-            elif i == 0xFF4A:
-                self.lcd.WY = value
-            elif i == 0xFF4B:
-                self.lcd.WX = value
-            else:
-                self.ram.io_ports[i - 0xFF00] = value
-        elif 0xFF4C <= i < 0xFF80: # Empty but unusable for I/O
-            if self.bootrom_enabled and i == 0xFF50 and value == 1:
-                self.bootrom_enabled = False
-            self.ram.non_io_internal_ram1[i - 0xFF4C] = value
-        elif 0xFF80 <= i < 0xFFFF: # Internal RAM
-            self.ram.internal_ram1[i - 0xFF80] = value
-        elif i == 0xFFFF: # Interrupt Enable Register
-            self.ram.interrupt_register[0] = value
+                    return
+
+                # Only compare 'i' to literals below, so Cython compiles the chain into a C switch
+                if i == 0xFF00:
+                    self.ram.memory[i - 0xC000] = self.interaction.pull(value)
+                elif i == 0xFF01:
+                    self.serialbuffer.append(value)
+                    self.ram.memory[i - 0xC000] = value
+                elif i == 0xFF04:
+                    self.timer.DIV = 0
+                elif i == 0xFF05:
+                    self.timer.TIMA = value
+                elif i == 0xFF06:
+                    self.timer.TMA = value
+                elif i == 0xFF07:
+                    self.timer.set_TAC(value)
+                elif i == 0xFF40:
+                    self.lcd.LCDC.set(value)
+                elif i == 0xFF42:
+                    self.lcd.SCY = value
+                elif i == 0xFF43:
+                    self.lcd.SCX = value
+                elif i == 0xFF46:
+                    self.transfer_DMA(value)
+                elif i == 0xFF47:
+                    # TODO: Move out of MB
+                    self.renderer.clearcache |= self.lcd.BGP.set(value)
+                elif i == 0xFF48:
+                    # TODO: Move out of MB
+                    self.renderer.clearcache |= self.lcd.OBP0.set(value)
+                elif i == 0xFF49:
+                    # TODO: Move out of MB
+                    self.renderer.clearcache |= self.lcd.OBP1.set(value)
+                elif i == 0xFF4A:
+                    self.lcd.WY = value
+                elif i == 0xFF4B:
+                    self.lcd.WX = value
+                else:
+                    self.ram.memory[i - 0xC000] = value
+            elif i < 0xFF80: # Empty but unusable for I/O
+                if self.bootrom_enabled and i == 0xFF50 and value == 1:
+                    self.bootrom_enabled = False
+                self.ram.memory[i - 0xC000] = value
+            else: # Internal RAM and Interrupt Enable Register
+                self.ram.memory[i - 0xC000] = value
         else:
             raise Exception("Memory access violation. Tried to write: %s" % hex(i))
 
     def transfer_DMA(self, src):
         # http://problemkaputt.de/pandocs.htm#lcdoamdmatransfers
         # TODO: Add timing delay of 160µs and disallow access to RAM!
-        dst = 0xFE00
         offset = src * 0x100
-        for n in range(0xA0):
-            self.setitem(dst + n, self.getitem(n + offset))
+        # A transfer never crosses a memory region, so from VRAM and internal RAM (including its echo), we can copy the
+        # whole block at once.
+        if 0x8000 <= offset < 0xA000:
+            self.lcd.OAM[:] = self.lcd.VRAM[offset - 0x8000:offset - 0x8000 + 0xA0]
+        elif 0xC000 <= offset < 0xE000:
+            self.lcd.OAM[:] = self.ram.memory[offset - 0xC000:offset - 0xC000 + 0xA0]
+        elif 0xE000 <= offset < 0xFE00:
+            self.lcd.OAM[:] = self.ram.memory[offset - 0xE000:offset - 0xE000 + 0xA0]
+        else:
+            # Reads from the cartridge can have side effects, so they go through getitem. The destination is always OAM.
+            for n in range(0xA0):
+                self.lcd.OAM[n] = self.getitem(n + offset)
@@ -12,7 +12,7 @@ from libc.stdint cimport uint8_t, uint16_t, uint32_t
 cdef uint16_t FLAGC, FLAGH, FLAGN, FLAGZ
 cdef uint8_t[512] OPCODE_LENGTHS
 cdef uint16_t opcode_length(uint16_t)
-@cython.locals(v=cython.int, a=cython.int, b=cython.int, pc=cython.ushort)
+@cython.locals(v=cython.int, a=cython.int, b=cython.int, pc=cython.ushort, group=cython.int)
 cdef int execute_opcode(cpu.CPU, uint16_t)
 
 cdef uint8_t no_opcode(cpu.CPU) except -1
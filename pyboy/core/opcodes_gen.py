@@ -33,7 +33,7 @@ from libc.stdint cimport uint8_t, uint16_t, uint32_t
 cdef uint16_t FLAGC, FLAGH, FLAGN, FLAGZ
 cdef uint8_t[512] OPCODE_LENGTHS
 cdef uint16_t opcode_length(uint16_t)
-@cython.locals(v=cython.int, a=cython.int, b=cython.int, pc=cython.ushort)
+@cython.locals(v=cython.int, a=cython.int, b=cython.int, pc=cython.ushort, group=cython.int)
 cdef int execute_opcode(cpu.CPU, uint16_t)
 
 cdef uint8_t no_opcode(cpu.CPU) except -1
@@ -1213,15 +1213,20 @@ def execute_opcode(cpu, opcode):
         b = cpu.mb.getitem(pc+1)
         v = (a << 8) + b
 
+    # Dispatch on groups of 16 opcodes first. Compiled, both levels are C switches, while in pure Python it saves
+    # hundreds of comparisons.
+    group = opcode >> 4
 """
         )
 
         indent = 4
         for i, t in enumerate(lookuplist):
             t = t if t is not None else (0, "no_opcode", "")
+            if i % 16 == 0:
+                f.write(" "*indent + ("if" if i == 0 else "elif") + " group == 0x%0.2X:\n" % (i >> 4))
             f.write(
-                " "*indent + ("if" if i == 0 else "elif") + " opcode == 0x%0.2X:\n"%i + " " * (indent+4) + "return " +
-                str(t[1]).replace("'", "") + ("(cpu)" if t[0] <= 1 else "(cpu, v)") + "\n"
+                " " * (indent+4) + ("if" if i % 16 == 0 else "elif") + " opcode == 0x%0.2X:\n"%i + " " *
+                (indent+8) + "return " + str(t[1]).replace("'", "") + ("(cpu)" if t[0] <= 1 else "(cpu, v)") + "\n"
             )
         f.write("\n\n")
 
@@ -6,12 +6,12 @@
 from libc.stdint cimport uint8_t
 from pyboy.utils cimport IntIOInterface
 
+cdef int INTERNAL_RAM0, NON_IO_INTERNAL_RAM0, IO_PORTS, NON_IO_INTERNAL_RAM1, INTERNAL_RAM1, INTERRUPT_ENABLE_REGISTER
+cdef int RAM_SIZE
+cdef int INTERNAL_RAM0_OFFSET, NON_IO_INTERNAL_RAM0_OFFSET, IO_PORTS_OFFSET, NON_IO_INTERNAL_RAM1_OFFSET
+cdef int INTERNAL_RAM1_OFFSET, INTERRUPT_ENABLE_REGISTER_OFFSET
+
 cdef class RAM:
     cdef void save_state(self, IntIOInterface)
     cdef void load_state(self, IntIOInterface, int)
-    cdef uint8_t[8*1024] internal_ram0
-    cdef uint8_t[0x60] non_io_internal_ram0
-    cdef uint8_t[0x4C] io_ports
-    cdef uint8_t[0x7F] internal_ram1
-    cdef uint8_t[0x34] non_io_internal_ram1
-    cdef uint8_t[0x01] interrupt_register
+    cdef uint8_t[0x4000] memory
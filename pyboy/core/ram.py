@@ -3,7 +3,6 @@
 # GitHub: https://github.com/Baekalfen/PyBoy
 #
 
-from array import array
 from random import getrandbits
 
 # MEMORY SIZES
@@ -14,52 +13,53 @@ NON_IO_INTERNAL_RAM1 = 0x34
 INTERNAL_RAM1 = 0x7F
 INTERRUPT_ENABLE_REGISTER = 1
 
+# All of the above are kept in one buffer, which covers 0xC000-0xFFFF and is indexed by `address - 0xC000`. The echo
+# of internal RAM (0xE000-0xFDFF) and OAM (0xFE00-0xFE9F) are not backed by it.
+RAM_SIZE = 0x4000
+INTERNAL_RAM0_OFFSET = 0xC000 - 0xC000
+NON_IO_INTERNAL_RAM0_OFFSET = 0xFEA0 - 0xC000
+IO_PORTS_OFFSET = 0xFF00 - 0xC000
+NON_IO_INTERNAL_RAM1_OFFSET = 0xFF4C - 0xC000
+INTERNAL_RAM1_OFFSET = 0xFF80 - 0xC000
+INTERRUPT_ENABLE_REGISTER_OFFSET = 0xFFFF - 0xC000
+
 
 class RAM:
     def __init__(self, randomize=False):
-        self.internal_ram0 = array("B", [0] * (INTERNAL_RAM0))
-        self.non_io_internal_ram0 = array("B", [0] * (NON_IO_INTERNAL_RAM0))
-        self.io_ports = array("B", [0] * (IO_PORTS))
-        self.internal_ram1 = array("B", [0] * (INTERNAL_RAM1))
-        self.non_io_internal_ram1 = array("B", [0] * (NON_IO_INTERNAL_RAM1))
-        self.interrupt_register = array("B", [0] * (INTERRUPT_ENABLE_REGISTER))
+        self.memory = bytearray(RAM_SIZE)
 
         if randomize:
             for i in range(INTERNAL_RAM0):
-                self.internal_ram0[i] = getrandbits(8)
+                self.memory[INTERNAL_RAM0_OFFSET + i] = getrandbits(8)
             for i in range(NON_IO_INTERNAL_RAM0):
-                self.non_io_internal_ram0[i] = getrandbits(8)
+                self.memory[NON_IO_INTERNAL_RAM0_OFFSET + i] = getrandbits(8)
             for i in range(INTERNAL_RAM1):
-                self.internal_ram1[i] = getrandbits(8)
+                self.memory[INTERNAL_RAM1_OFFSET + i] = getrandbits(8)
             for i in range(NON_IO_INTERNAL_RAM1):
-                self.non_io_internal_ram1[i] = getrandbits(8)
+                self.memory[NON_IO_INTERNAL_RAM1_OFFSET + i] = getrandbits(8)
 
     def save_state(self, f):
-        for n in range(INTERNAL_RAM0):
-            f.write(self.internal_ram0[n])
-        for n in range(NON_IO_INTERNAL_RAM0):
-            f.write(self.non_io_internal_ram0[n])
-        for n in range(IO_PORTS):
-            f.write(self.io_ports[n])
+        f.write_bytes(self.memory[INTERNAL_RAM0_OFFSET:INTERNAL_RAM0_OFFSET + INTERNAL_RAM0])
+        f.write_bytes(self.memory[NON_IO_INTERNAL_RAM0_OFFSET:NON_IO_INTERNAL_RAM0_OFFSET + NON_IO_INTERNAL_RAM0])
+        f.write_bytes(self.memory[IO_PORTS_OFFSET:IO_PORTS_OFFSET + IO_PORTS])
         # TODO: Order of INTERNAL_RAM1 and NON_IO_INTERNAL_RAM1 is flipped
-        for n in range(INTERNAL_RAM1):
-            f.write(self.internal_ram1[n])
-        for n in range(NON_IO_INTERNAL_RAM1):
-            f.write(self.non_io_internal_ram1[n])
-        for n in range(INTERRUPT_ENABLE_REGISTER):
-            f.write(self.interrupt_register[n])
+        f.write_bytes(self.memory[INTERNAL_RAM1_OFFSET:INTERNAL_RAM1_OFFSET + INTERNAL_RAM1])
+        f.write_bytes(self.memory[NON_IO_INTERNAL_RAM1_OFFSET:NON_IO_INTERNAL_RAM1_OFFSET + NON_IO_INTERNAL_RAM1])
+        f.write_bytes(
+            self.memory[INTERRUPT_ENABLE_REGISTER_OFFSET:INTERRUPT_ENABLE_REGISTER_OFFSET + INTERRUPT_ENABLE_REGISTER]
+        )
 
     def load_state(self, f, state_version):
         for n in range(INTERNAL_RAM0):
-            self.internal_ram0[n] = f.read()
+            self.memory[INTERNAL_RAM0_OFFSET + n] = f.read()
         for n in range(NON_IO_INTERNAL_RAM0):
-            self.non_io_internal_ram0[n] = f.read()
+            self.memory[NON_IO_INTERNAL_RAM0_OFFSET + n] = f.read()
         for n in range(IO_PORTS):
-            self.io_ports[n] = f.read()
+            self.memory[IO_PORTS_OFFSET + n] = f.read()
         # TODO: Order of INTERNAL_RAM1 and NON_IO_INTERNAL_RAM1 is flipped
         for n in range(INTERNAL_RAM1):
-            self.internal_ram1[n] = f.read()
+            self.memory[INTERNAL_RAM1_OFFSET + n] = f.read()
         for n in range(NON_IO_INTERNAL_RAM1):
-            self.non_io_internal_ram1[n] = f.read()
+            self.memory[NON_IO_INTERNAL_RAM1_OFFSET + n] = f.read()
         for n in range(INTERRUPT_ENABLE_REGISTER):
-            self.interrupt_register[n] = f.read()
+            self.memory[INTERRUPT_ENABLE_REGISTER_OFFSET + n] = f.read()
@@ -48,6 +48,12 @@ cdef class Sound:
     cdef void sync(self)
 
 
+cdef class NullSound(Sound):
+    cdef uint8_t get(self, uint8_t)
+    cdef void set(self, uint8_t, uint8_t)
+    cdef void sync(self)
+
+
 cdef class ToneChannel:
     cdef uint8_t[4][8] wavetables
 
@@ -166,6 +166,24 @@ class Sound:
         pass
 
 
+class NullSound(Sound):
+    """Takes the place of Sound, when sound is disabled. It doesn't open an audio device or emulate any channels"""
+    def __init__(self):
+        self.clock = 0
+
+    def get(self, offset):
+        return 0
+
+    def set(self, offset, value):
+        pass
+
+    def sync(self):
+        self.clock = 0
+
+    def stop(self):
+        pass
+
+
 class ToneChannel:
     """Second sound channel--simple square wave, no sweep"""
     def __init__(self):
@@ -12,10 +12,12 @@ cdef class Timer:
     cdef uint64_t DIV, TIMA, TMA, TAC
     cdef uint16_t DIV_counter, TIMA_counter
     cdef uint64_t[4] dividers
+    cdef bint enabled
+    cdef int divider
 
-    @cython.locals(divider=cython.int)
+    cdef void set_TAC(self, uint64_t)
     cdef bint tick(self, uint64_t)
-    @cython.locals(divider=cython.int, cyclesleft=cython.uint)
+    @cython.locals(cyclesleft=cython.uint)
     cdef uint64_t cyclestointerrupt(self)
 
     cdef void save_state(self, IntIOInterface)
@@ -26,6 +26,13 @@ class Timer:
         self.TMA = 0
         self.TAC = 0
         self.dividers = [1024, 16, 64, 256]
+        self.set_TAC(0)
+
+    def set_TAC(self, value):
+        # Decode TAC only when it's written, instead of on every tick
+        self.TAC = value & 0b111
+        self.enabled = self.TAC & 0b100 != 0
+        self.divider = self.dividers[self.TAC & 0b11]
 
     def tick(self, cycles):
         self.DIV_counter += cycles
@@ -33,14 +40,13 @@ class Timer:
         self.DIV_counter &= 0xFF # Remove the overflown bits
         self.DIV &= 0xFF
 
-        if self.TAC & 0b100 == 0: # Check if timer is not enabled
+        if not self.enabled:
             return False
 
         self.TIMA_counter += cycles
-        divider = self.dividers[self.TAC & 0b11]
 
-        if self.TIMA_counter >= divider:
-            self.TIMA_counter -= divider # Keeps possible remainder
+        if self.TIMA_counter >= self.divider:
+            self.TIMA_counter -= self.divider # Keeps possible remainder
             self.TIMA += 1
 
             if self.TIMA > 0xFF:
@@ -51,13 +57,11 @@ class Timer:
         return False
 
     def cyclestointerrupt(self):
-        if self.TAC & 0b100 == 0: # Check if timer is not enabled
+        if not self.enabled:
             # Large enough, that 'calculate_cycles' will choose 'x'
             return 1 << 16
 
-        divider = self.dividers[self.TAC & 0b11]
-
-        cyclesleft = ((0x100 - self.TIMA) * divider) - self.TIMA_counter
+        cyclesleft = ((0x100 - self.TIMA) * self.divider) - self.TIMA_counter
 
         return cyclesleft
 
@@ -75,4 +79,4 @@ class Timer:
         self.DIV_counter = f.read_16bit()
         self.TIMA_counter = f.read_16bit()
         self.TMA = f.read()
-        self.TAC = f.read()
+        self.set_TAC(f.read())
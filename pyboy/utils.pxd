@@ -12,6 +12,8 @@ from libc.stdint cimport uint8_t, int64_t
 
 cdef class IntIOInterface:
     cdef int64_t write(self, uint8_t)
+    @cython.locals(byte=uint8_t)
+    cdef int64_t write_bytes(self, bytes)
     cdef uint8_t read(self)
     cdef void seek(self, int64_t)
     cdef void flush(self)
@@ -16,6 +16,12 @@ class IntIOInterface:
     def write(self, byte):
         raise Exception("Not implemented!")
 
+    def write_bytes(self, data):
+        # Fallback for buffers, that have to process each byte individually
+        for byte in data:
+            self.write(byte)
+        return len(data)
+
     def write_16bit(self, value):
         self.write(value & 0xFF)
         self.write((value & 0xFF00) >> 8)
@@ -57,6 +63,9 @@ class IntIOWrapper(IntIOInterface):
         assert 0 <= byte <= 0xFF
         return self.buffer.write(byte.to_bytes(1, "little"))
 
+    def write_bytes(self, data):
+        return self.buffer.write(data)
+
     def read(self):
         # assert count == 1, "Only a count of 1 is supported"
         data = self.buffer.read(1)